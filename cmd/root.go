@@ -33,8 +33,8 @@ using AI to select appropriate content from your media library.
 It integrates with Radarr, Sonarr, and Tunarr to create intelligent
 programming schedules based on configurable themes.`,
 	PersistentPreRunE: func(cmd *cobra.Command, _ []string) error {
-		// Skip config loading for version command
-		if cmd.Name() == "version" {
+		// Skip config loading for commands that never use it
+		if skipsConfig(cmd) {
 			return nil
 		}
 		return initConfig()
@@ -77,6 +77,17 @@ func init() {
 	rootCmd.AddCommand(traktCmd)
 }
 
+// skipsConfig reports whether cmd runs without configuration. Shell
+// completion is included since it is invoked on every tab press.
+func skipsConfig(cmd *cobra.Command) bool {
+	switch cmd.Name() {
+	case "version", "help", "completion", cobra.ShellCompRequestCmd, cobra.ShellCompNoDescRequestCmd:
+		return true
+	}
+	// Per-shell script generators, e.g. "completion bash"
+	return cmd.HasParent() && cmd.Parent().Name() == "completion"
+}
+
 func initConfig() error {
 	// Initialize logger with enhanced formatting
 	logLevel := slog.LevelInfo
@@ -5,6 +5,7 @@ import (
 	"fmt"
 	"os"
 	"os/signal"
+	"sort"
 	"syscall"
 
 	"github.com/spf13/cobra"
@@ -192,15 +193,17 @@ func getMediaStatistics(
 		return nil, fmt.Errorf("failed to count cooldowns: %w", err)
 	}
 
-	// Get all media for genre and rating stats
-	allMedia, err := mediaRepo.List(ctx, repository.ListMediaOptions{
+	// Get genre, rating and size columns for the library stats
+	allMedia, err := mediaRepo.ListStats(ctx, repository.ListMediaOptions{
 		HasFile: &hasFile,
 		Limit:   1000,
 	})
 	if err == nil {
 		totalRating := 0.0
 		ratingCount := 0
-		for _, m := range allMedia {
+		for i := range allMedia {
+			m := &allMedia[i]
+
 			// Count genres
 			for _, genre := range m.Genres {
 				stats.TopGenres[genre]++
@@ -283,19 +286,18 @@ func printMediaSummary(stats *MediaStatistics, detailed bool) {
 			genre string
 			count int
 		}
-		var genres []genreCount
+		genres := make([]genreCount, 0, len(stats.TopGenres))
 		for genre, count := range stats.TopGenres {
 			genres = append(genres, genreCount{genre, count})
 		}
 
-		// Simple bubble sort
-		for i := 0; i < len(genres); i++ {
-			for j := i + 1; j < len(genres); j++ {
-				if genres[i].count < genres[j].count {
-					genres[i], genres[j] = genres[j], genres[i]
-				}
+		// Highest count first, ties broken by name for a stable listing
+		sort.Slice(genres, func(i, j int) bool {
+			if genres[i].count != genres[j].count {
+				return genres[i].count > genres[j].count
 			}
-		}
+			return genres[i].genre < genres[j].genre
+		})
 
 		// Show top 10
 		maxGenres := 10
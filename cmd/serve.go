@@ -9,6 +9,7 @@ import (
 
 	"github.com/spf13/cobra"
 
+	"github.com/geekxflood/program-director/internal/clients/arr"
 	"github.com/geekxflood/program-director/internal/clients/ollama"
 	"github.com/geekxflood/program-director/internal/clients/radarr"
 	"github.com/geekxflood/program-director/internal/clients/sonarr"
@@ -119,6 +120,7 @@ func runServe(_ *cobra.Command, _ []string) error {
 	// Initialize API clients
 	radarrClient := radarr.New(&cfg.Radarr)
 	sonarrClient := sonarr.New(&cfg.Sonarr)
+	defer arr.CloseIdleConnections()
 	tunarrClient := tunarr.New(&cfg.Tunarr)
 	ollamaClient := ollama.New(&cfg.Ollama)
 
@@ -9,6 +9,7 @@ import (
 
 	"github.com/spf13/cobra"
 
+	"github.com/geekxflood/program-director/internal/clients/arr"
 	"github.com/geekxflood/program-director/internal/clients/radarr"
 	"github.com/geekxflood/program-director/internal/clients/sonarr"
 	"github.com/geekxflood/program-director/internal/database"
@@ -107,13 +108,34 @@ func runSync(_ *cobra.Command, _ []string) error {
 	// Initialize API clients
 	radarrClient := radarr.New(&cfg.Radarr)
 	sonarrClient := sonarr.New(&cfg.Sonarr)
+	defer arr.CloseIdleConnections()
 
 	// Create sync service
 	syncService := media.NewSyncService(radarrClient, sonarrClient, mediaRepo, logger)
 
-	var results []media.SyncResult
+	var (
+		results []media.SyncResult
+		syncErr error
+	)
 
-	if syncMovies {
+	if syncMovies && syncSeries {
+		logger.Info("syncing movies and series from Radarr and Sonarr",
+			"radarr_url", cfg.Radarr.URL,
+			"sonarr_url", cfg.Sonarr.URL,
+		)
+		// A failed library still lets the other one be stored and reported
+		movieResult, seriesResult, err := syncService.SyncAll(ctx, syncCleanup)
+		if movieResult != nil {
+			results = append(results, *movieResult)
+		}
+		if seriesResult != nil {
+			results = append(results, *seriesResult)
+		}
+		if err != nil {
+			logger.Error("media sync failed", "error", err)
+			syncErr = fmt.Errorf("media sync failed: %w", err)
+		}
+	} else if syncMovies {
 		logger.Info("syncing movies from Radarr",
 			"url", cfg.Radarr.URL,
 		)
@@ -123,9 +145,7 @@ func runSync(_ *cobra.Command, _ []string) error {
 			return fmt.Errorf("movie sync failed: %w", err)
 		}
 		results = append(results, *result)
-	}
-
-	if syncSeries {
+	} else if syncSeries {
 		logger.Info("syncing series from Sonarr",
 			"url", cfg.Sonarr.URL,
 		)
@@ -165,6 +185,9 @@ func runSync(_ *cobra.Command, _ []string) error {
 		fmt.Printf("\n%s:\n", result.Source)
 		fmt.Printf("  Created:  %d\n", result.Created)
 		fmt.Printf("  Updated:  %d\n", result.Updated)
+		if result.Skipped > 0 {
+			fmt.Printf("  Skipped:  %d\n", result.Skipped)
+		}
 		if syncCleanup {
 			fmt.Printf("  Deleted:  %d\n", result.Deleted)
 		}
@@ -175,5 +198,5 @@ func runSync(_ *cobra.Command, _ []string) error {
 	}
 	fmt.Println()
 
-	return nil
+	return syncErr
 }
@@ -0,0 +1,41 @@
+// Package arr provides HTTP plumbing shared by the Radarr and Sonarr clients.
+package arr
+
+import (
+	"net"
+	"net/http"
+	"time"
+)
+
+// sharedClient is used by every Radarr and Sonarr client so they draw from
+// one pool of keep-alive connections instead of each dialing their own.
+// HTTP/2 is negotiated over TLS, and the transport requests gzip and decodes
+// it transparently, so callers must not set Accept-Encoding themselves.
+var sharedClient = &http.Client{
+	Timeout: 30 * time.Second,
+	Transport: &http.Transport{
+		Proxy: http.ProxyFromEnvironment,
+		DialContext: (&net.Dialer{
+			Timeout:   5 * time.Second,
+			KeepAlive: 30 * time.Second,
+		}).DialContext,
+		ForceAttemptHTTP2:     true,
+		MaxIdleConns:          50,
+		MaxIdleConnsPerHost:   20,
+		MaxConnsPerHost:       50,
+		IdleConnTimeout:       30 * time.Second,
+		TLSHandshakeTimeout:   10 * time.Second,
+		ExpectContinueTimeout: 1 * time.Second,
+	},
+}
+
+// HTTPClient returns the HTTP client shared by the Radarr and Sonarr clients
+func HTTPClient() *http.Client {
+	return sharedClient
+}
+
+// CloseIdleConnections closes the shared pool's idle keep-alive connections.
+// Commands defer it once when done with the Radarr and Sonarr clients.
+func CloseIdleConnections() {
+	sharedClient.CloseIdleConnections()
+}
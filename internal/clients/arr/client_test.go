@@ -0,0 +1,44 @@
+package arr
+
+import (
+	"compress/gzip"
+	"io"
+	"net/http"
+	"net/http/httptest"
+	"testing"
+)
+
+func TestHTTPClientDecodesGzip(t *testing.T) {
+	const body = `[{"title":"Alien"}]`
+
+	server := httptest.NewServer(http.HandlerFunc(func(w http.ResponseWriter, r *http.Request) {
+		if r.Header.Get("Accept-Encoding") != "gzip" {
+			t.Errorf("expected gzip to be requested, got %q", r.Header.Get("Accept-Encoding"))
+		}
+		w.Header().Set("Content-Type", "application/json")
+		w.Header().Set("Content-Encoding", "gzip")
+		gz := gzip.NewWriter(w)
+		_, _ = gz.Write([]byte(body))
+		_ = gz.Close()
+	}))
+	defer server.Close()
+
+	resp, err := HTTPClient().Get(server.URL)
+	if err != nil {
+		t.Fatalf("unexpected error: %v", err)
+	}
+	defer func() { _ = resp.Body.Close() }()
+
+	got, err := io.ReadAll(resp.Body)
+	if err != nil {
+		t.Fatalf("unexpected error: %v", err)
+	}
+
+	if string(got) != body {
+		t.Errorf("expected decoded body %s, got %s", body, got)
+	}
+
+	if !resp.Uncompressed {
+		t.Error("expected response to be transparently decompressed")
+	}
+}
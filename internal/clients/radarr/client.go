@@ -8,8 +8,8 @@ import (
 	"io"
 	"net/http"
 	"net/url"
-	"time"
 
+	"github.com/geekxflood/program-director/internal/clients/arr"
 	"github.com/geekxflood/program-director/internal/config"
 	"github.com/geekxflood/program-director/pkg/models"
 )
@@ -24,65 +24,42 @@ type Client struct {
 // New creates a new Radarr client
 func New(cfg *config.RadarrConfig) *Client {
 	return &Client{
-		baseURL: cfg.URL,
-		apiKey:  cfg.APIKey,
-		httpClient: &http.Client{
-			Timeout: 30 * time.Second,
-		},
+		baseURL:    cfg.URL,
+		apiKey:     cfg.APIKey,
+		httpClient: arr.HTTPClient(),
 	}
 }
 
-// Movie represents a movie from Radarr API
+// Movie represents a movie from Radarr API. Only the fields consumed by
+// ToMedia are decoded; the rest of each payload (movieFile, images,
+// alternateTitles, ...) is skipped by the decoder without allocating.
 type Movie struct {
-	ID         int64      `json:"id"`
-	Title      string     `json:"title"`
-	Year       int        `json:"year"`
-	Overview   string     `json:"overview"`
-	Runtime    int        `json:"runtime"`
-	Genres     []string   `json:"genres"`
-	Status     string     `json:"status"`
-	Monitored  bool       `json:"monitored"`
-	Path       string     `json:"path"`
-	HasFile    bool       `json:"hasFile"`
-	SizeOnDisk int64      `json:"sizeOnDisk"`
-	IMDBID     string     `json:"imdbId"`
-	TMDBID     int64      `json:"tmdbId"`
-	Ratings    Ratings    `json:"ratings"`
-	MovieFile  *MovieFile `json:"movieFile,omitempty"`
-	Popularity float64    `json:"popularity"`
+	ID         int64    `json:"id"`
+	Title      string   `json:"title"`
+	Year       int      `json:"year"`
+	Overview   string   `json:"overview"`
+	Runtime    int      `json:"runtime"`
+	Genres     []string `json:"genres"`
+	Status     string   `json:"status"`
+	Monitored  bool     `json:"monitored"`
+	Path       string   `json:"path"`
+	HasFile    bool     `json:"hasFile"`
+	SizeOnDisk int64    `json:"sizeOnDisk"`
+	IMDBID     string   `json:"imdbId"`
+	TMDBID     int64    `json:"tmdbId"`
+	Ratings    Ratings  `json:"ratings"`
+	Popularity float64  `json:"popularity"`
 }
 
 // Ratings holds rating information
 type Ratings struct {
-	IMDB           Rating `json:"imdb"`
-	TMDB           Rating `json:"tmdb"`
-	RottenTomatoes Rating `json:"rottenTomatoes"`
+	IMDB Rating `json:"imdb"`
+	TMDB Rating `json:"tmdb"`
 }
 
 // Rating holds individual rating values
 type Rating struct {
 	Value float64 `json:"value"`
-	Votes int64   `json:"votes"`
-}
-
-// MovieFile holds movie file information
-type MovieFile struct {
-	ID      int64   `json:"id"`
-	Path    string  `json:"path"`
-	Size    int64   `json:"size"`
-	Quality Quality `json:"quality"`
-}
-
-// Quality holds quality information
-type Quality struct {
-	Quality QualityInfo `json:"quality"`
-}
-
-// QualityInfo holds quality details
-type QualityInfo struct {
-	ID         int    `json:"id"`
-	Name       string `json:"name"`
-	Resolution int    `json:"resolution"`
 }
 
 // GetMovies retrieves all movies from Radarr
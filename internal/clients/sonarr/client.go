@@ -9,8 +9,8 @@ import (
 	"net/http"
 	"net/url"
 	"strings"
-	"time"
 
+	"github.com/geekxflood/program-director/internal/clients/arr"
 	"github.com/geekxflood/program-director/internal/config"
 	"github.com/geekxflood/program-director/pkg/models"
 )
@@ -25,15 +25,15 @@ type Client struct {
 // New creates a new Sonarr client
 func New(cfg *config.SonarrConfig) *Client {
 	return &Client{
-		baseURL: cfg.URL,
-		apiKey:  cfg.APIKey,
-		httpClient: &http.Client{
-			Timeout: 30 * time.Second,
-		},
+		baseURL:    cfg.URL,
+		apiKey:     cfg.APIKey,
+		httpClient: arr.HTTPClient(),
 	}
 }
 
-// Series represents a series from Sonarr API
+// Series represents a series from Sonarr API. Only the fields consumed by
+// ToMedia are decoded; the rest of each payload (seasons, images, ...) is
+// skipped by the decoder without allocating.
 type Series struct {
 	ID         int64    `json:"id"`
 	Title      string   `json:"title"`
@@ -54,17 +54,12 @@ type Series struct {
 // Ratings holds rating information
 type Ratings struct {
 	Value float64 `json:"value"`
-	Votes int64   `json:"votes"`
 }
 
 // Stats holds series statistics
 type Stats struct {
-	SeasonCount       int     `json:"seasonCount"`
-	EpisodeCount      int     `json:"episodeCount"`
-	EpisodeFileCount  int     `json:"episodeFileCount"`
-	TotalEpisodeCount int     `json:"totalEpisodeCount"`
-	SizeOnDisk        int64   `json:"sizeOnDisk"`
-	PercentOfEpisodes float64 `json:"percentOfEpisodes"`
+	EpisodeFileCount int   `json:"episodeFileCount"`
+	SizeOnDisk       int64 `json:"sizeOnDisk"`
 }
 
 // GetSeries retrieves all series from Sonarr
@@ -111,26 +106,22 @@ func (s *Series) ToMedia() *models.Media {
 	}
 }
 
-// isAnime checks if the genres indicate anime content
+// isAnime checks if the genres indicate anime content: an "anime" genre, or
+// "animation" alongside a Japanese genre. Genres are lowercased once each.
 func isAnime(genres []string) bool {
+	var animation, japanese bool
 	for _, g := range genres {
 		g = strings.ToLower(g)
-		if g == "anime" || g == "animation" && containsJapanese(genres) {
+		if g == "anime" {
 			return true
 		}
-	}
-	return false
-}
-
-// containsJapanese checks if genres suggest Japanese content
-func containsJapanese(genres []string) bool {
-	for _, g := range genres {
-		g = strings.ToLower(g)
-		if strings.Contains(g, "japanese") || strings.Contains(g, "japan") {
-			return true
+		if g == "animation" {
+			animation = true
+		} else if strings.Contains(g, "japan") {
+			japanese = true
 		}
 	}
-	return false
+	return animation && japanese
 }
 
 // newRequest creates a new HTTP request with API key header
@@ -0,0 +1,50 @@
+package sonarr
+
+import (
+	"testing"
+
+	"github.com/geekxflood/program-director/pkg/models"
+)
+
+func TestIsAnime(t *testing.T) {
+	tests := []struct {
+		name   string
+		genres []string
+		want   bool
+	}{
+		{"anime genre", []string{"Action", "Anime"}, true},
+		{"animation with japanese", []string{"Animation", "Japanese"}, true},
+		{"japanese before animation", []string{"Japan", "Drama", "ANIMATION"}, true},
+		{"animation only", []string{"Animation", "Comedy"}, false},
+		{"japanese only", []string{"Japanese", "Drama"}, false},
+		{"no genres", nil, false},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			if got := isAnime(tt.genres); got != tt.want {
+				t.Errorf("isAnime(%v) = %v, want %v", tt.genres, got, tt.want)
+			}
+		})
+	}
+}
+
+func TestSeriesToMediaType(t *testing.T) {
+	tests := []struct {
+		name   string
+		series Series
+		want   models.MediaType
+	}{
+		{"standard series", Series{SeriesType: "standard", Genres: []string{"Drama"}}, models.MediaTypeSeries},
+		{"anime series type", Series{SeriesType: "anime", Genres: []string{"Action"}}, models.MediaTypeAnime},
+		{"anime by genre", Series{SeriesType: "standard", Genres: []string{"Anime"}}, models.MediaTypeAnime},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			if got := tt.series.ToMedia().MediaType; got != tt.want {
+				t.Errorf("ToMedia().MediaType = %v, want %v", got, tt.want)
+			}
+		})
+	}
+}
@@ -107,6 +107,28 @@ type ThemeConfig struct {
 	Duration    int      `mapstructure:"duration"` // Target duration in minutes
 }
 
+// envPrefix is the prefix for automatic environment variable overrides
+const envPrefix = "PROGRAMDIR"
+
+// envBindings maps environment variables to config keys
+var envBindings = map[string]string{
+	"RADARR_API_KEY":      "radarr.api_key",
+	"SONARR_API_KEY":      "sonarr.api_key",
+	"RADARR_URL":          "radarr.url",
+	"SONARR_URL":          "sonarr.url",
+	"TUNARR_URL":          "tunarr.url",
+	"TRAKT_CLIENT_ID":     "trakt.client_id",
+	"TRAKT_CLIENT_SECRET": "trakt.client_secret",
+	"OLLAMA_URL":          "ollama.url",
+	"OLLAMA_MODEL":        "ollama.model",
+	"DB_DRIVER":           "database.driver",
+	"POSTGRES_HOST":       "database.postgres.host",
+	"POSTGRES_PORT":       "database.postgres.port",
+	"POSTGRES_DATABASE":   "database.postgres.database",
+	"POSTGRES_USER":       "database.postgres.user",
+	"POSTGRES_PASSWORD":   "database.postgres.password",
+}
+
 // Load reads configuration from file and environment variables
 func Load(configFile string) (*Config, error) {
 	v := viper.New()
@@ -117,6 +139,11 @@ func Load(configFile string) (*Config, error) {
 	// Determine config file path
 	if configFile != "" {
 		v.SetConfigFile(configFile)
+		// Files without an extension (e.g. mounted ConfigMaps) are YAML;
+		// pin the decoder instead of letting viper reject them
+		if filepath.Ext(configFile) == "" {
+			v.SetConfigType("yaml")
+		}
 	} else {
 		// Search for config in common locations
 		v.SetConfigName("config")
@@ -141,7 +168,7 @@ func Load(configFile string) (*Config, error) {
 	}
 
 	// Environment variable overrides
-	v.SetEnvPrefix("PROGRAMDIR")
+	v.SetEnvPrefix(envPrefix)
 	v.SetEnvKeyReplacer(strings.NewReplacer(".", "_"))
 	v.AutomaticEnv()
 
@@ -200,33 +227,13 @@ func setDefaults(v *viper.Viper) {
 	v.SetDefault("server.shutdown_timeout", 30)
 }
 
-// bindEnvVars maps environment variables to config keys
+// bindEnvVars maps environment variables to config keys. Every key is
+// bound, set or not, so viper's Unmarshal also sees keys that only come from
+// PROGRAMDIR_-prefixed variables.
 func bindEnvVars(v *viper.Viper) {
-	// Direct environment variable mappings
-	bindings := []struct {
-		key string
-		env string
-	}{
-		{"radarr.api_key", "RADARR_API_KEY"},
-		{"sonarr.api_key", "SONARR_API_KEY"},
-		{"radarr.url", "RADARR_URL"},
-		{"sonarr.url", "SONARR_URL"},
-		{"tunarr.url", "TUNARR_URL"},
-		{"trakt.client_id", "TRAKT_CLIENT_ID"},
-		{"trakt.client_secret", "TRAKT_CLIENT_SECRET"},
-		{"ollama.url", "OLLAMA_URL"},
-		{"ollama.model", "OLLAMA_MODEL"},
-		{"database.driver", "DB_DRIVER"},
-		{"database.postgres.host", "POSTGRES_HOST"},
-		{"database.postgres.port", "POSTGRES_PORT"},
-		{"database.postgres.database", "POSTGRES_DATABASE"},
-		{"database.postgres.user", "POSTGRES_USER"},
-		{"database.postgres.password", "POSTGRES_PASSWORD"},
-	}
-
-	for _, b := range bindings {
-		if err := v.BindEnv(b.key, b.env); err != nil {
-			panic(fmt.Sprintf("failed to bind env var %s: %v", b.env, err))
+	for env, key := range envBindings {
+		if err := v.BindEnv(key, env); err != nil {
+			panic(fmt.Sprintf("failed to bind env var %s: %v", env, err))
 		}
 	}
 }
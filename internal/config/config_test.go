@@ -2,6 +2,7 @@ package config
 
 import (
 	"os"
+	"path/filepath"
 	"testing"
 )
 
@@ -215,6 +216,52 @@ func TestLoadConfigWithDefaults(t *testing.T) {
 	}
 }
 
+func TestLoadExtensionlessConfigFile(t *testing.T) {
+	path := filepath.Join(t.TempDir(), "config")
+	data := []byte(`radarr:
+  api_key: file-radarr-key
+sonarr:
+  api_key: file-sonarr-key
+ollama:
+  model: file-model
+`)
+	if err := os.WriteFile(path, data, 0600); err != nil {
+		t.Fatalf("failed to write config file: %v", err)
+	}
+
+	cfg, err := Load(path)
+	if err != nil {
+		t.Fatalf("Load() error = %v", err)
+	}
+
+	if cfg.Radarr.APIKey != "file-radarr-key" {
+		t.Errorf("Radarr API key = %v, want file-radarr-key", cfg.Radarr.APIKey)
+	}
+	if cfg.Ollama.Model != "file-model" {
+		t.Errorf("Ollama model = %v, want file-model", cfg.Ollama.Model)
+	}
+	if cfg.Ollama.URL != "http://ollama:11434" {
+		t.Errorf("Default ollama URL = %v, want http://ollama:11434", cfg.Ollama.URL)
+	}
+}
+
+func TestLoadPrefixedEnvWithoutConfigFile(t *testing.T) {
+	t.Setenv("PROGRAMDIR_RADARR_API_KEY", "prefixed-radarr-key")
+	t.Setenv("PROGRAMDIR_SONARR_API_KEY", "prefixed-sonarr-key")
+
+	cfg, err := Load(filepath.Join(t.TempDir(), "missing.yaml"))
+	if err != nil {
+		t.Fatalf("Load() error = %v", err)
+	}
+
+	if cfg.Radarr.APIKey != "prefixed-radarr-key" {
+		t.Errorf("Radarr API key = %v, want prefixed-radarr-key", cfg.Radarr.APIKey)
+	}
+	if cfg.Sonarr.APIKey != "prefixed-sonarr-key" {
+		t.Errorf("Sonarr API key = %v, want prefixed-sonarr-key", cfg.Sonarr.APIKey)
+	}
+}
+
 // Helper function to check if string contains substring
 func contains(s, substr string) bool {
 	return len(s) >= len(substr) && (s == substr || len(substr) == 0 ||
@@ -0,0 +1,10 @@
+-- Index for genre-based candidate lookups
+-- ListByGenres runs one branch per media type filtering on media_type and
+-- has_file and returning the top 100 by rating; with this index each branch
+-- walks rows in rating order and stops at its LIMIT instead of scanning and
+-- sorting every row of the type
+CREATE INDEX IF NOT EXISTS idx_media_genre_lookup
+    ON media(media_type, has_file, imdb_rating DESC, popularity DESC);
+
+-- idx_media_media_type is a prefix of the index above and is now redundant
+DROP INDEX IF EXISTS idx_media_media_type;
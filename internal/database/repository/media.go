@@ -108,52 +108,7 @@ func (r *MediaRepository) List(ctx context.Context, opts ListMediaOptions) ([]mo
 			status, monitored, synced_at, created_at, updated_at
 		FROM media WHERE 1=1
 	`
-	args := make([]interface{}, 0)
-	argIndex := 1
-
-	if opts.Source != "" {
-		query += fmt.Sprintf(" AND source = $%d", argIndex)
-		args = append(args, opts.Source)
-		argIndex++
-	}
-
-	if opts.MediaType != "" {
-		query += fmt.Sprintf(" AND media_type = $%d", argIndex)
-		args = append(args, opts.MediaType)
-		argIndex++
-	}
-
-	if opts.HasFile != nil {
-		query += fmt.Sprintf(" AND has_file = $%d", argIndex)
-		args = append(args, *opts.HasFile)
-		argIndex++
-	}
-
-	if opts.MinRating > 0 {
-		query += fmt.Sprintf(" AND imdb_rating >= $%d", argIndex)
-		args = append(args, opts.MinRating)
-		argIndex++
-	}
-
-	// Order by
-	if opts.OrderBy != "" {
-		query += " ORDER BY " + opts.OrderBy
-	} else {
-		query += " ORDER BY title"
-	}
-
-	// Limit
-	if opts.Limit > 0 {
-		query += fmt.Sprintf(" LIMIT $%d", argIndex)
-		args = append(args, opts.Limit)
-		argIndex++
-	}
-
-	// Offset
-	if opts.Offset > 0 {
-		query += fmt.Sprintf(" OFFSET $%d", argIndex)
-		args = append(args, opts.Offset)
-	}
+	query, args := appendListClauses(query, opts)
 
 	rows, err := r.db.Query(ctx, query, args...)
 	if err != nil {
@@ -179,57 +134,108 @@ func (r *MediaRepository) List(ctx context.Context, opts ListMediaOptions) ([]mo
 	return media, rows.Err()
 }
 
-// ListByGenres retrieves media that has any of the specified genres
-func (r *MediaRepository) ListByGenres(ctx context.Context, genres []string, mediaType models.MediaType, excludeIDs []int64) ([]models.Media, error) {
-	// Build genre condition
-	genreConditions := ""
-	args := make([]interface{}, 0)
-	argIndex := 1
+// ListStats retrieves only the genre, rating and size columns of media, with
+// the same filtering, ordering and paging as List, for building library
+// statistics. Other fields of the returned records are left zero.
+func (r *MediaRepository) ListStats(ctx context.Context, opts ListMediaOptions) ([]models.Media, error) {
+	query := "SELECT genres, imdb_rating, tmdb_rating, size_on_disk FROM media WHERE 1=1"
+	query, args := appendListClauses(query, opts)
 
-	var genreConditionsSb247 strings.Builder
-	for i, genre := range genres {
-		if i > 0 {
-			genreConditionsSb247.WriteString(" OR ")
+	rows, err := r.db.Query(ctx, query, args...)
+	if err != nil {
+		return nil, err
+	}
+	defer func() { _ = rows.Close() }()
+
+	var media []models.Media
+	for rows.Next() {
+		var m models.Media
+		if err := rows.Scan(&m.Genres, &m.IMDBRating, &m.TMDBRating, &m.SizeOnDisk); err != nil {
+			return nil, err
 		}
-		genreConditionsSb247.WriteString(fmt.Sprintf("genres LIKE $%d", argIndex))
-		args = append(args, "%"+genre+"%")
-		argIndex++
+		media = append(media, m)
 	}
-	genreConditions += genreConditionsSb247.String()
 
-	query := fmt.Sprintf(`
-		SELECT id, external_id, source, media_type, title, year, overview, runtime,
+	return media, rows.Err()
+}
+
+// ListByGenres retrieves media that has any of the specified genres. The
+// given media types are fetched in a single round trip, keeping the best
+// rated 100 of each type, and returned grouped in the order the types are
+// listed. An empty mediaTypes returns the best rated 100 of any type.
+func (r *MediaRepository) ListByGenres(ctx context.Context, genres []string, mediaTypes []models.MediaType, excludeIDs []int64) ([]models.Media, error) {
+	const columns = `id, external_id, source, media_type, title, year, overview, runtime,
 			genres, imdb_rating, tmdb_rating, popularity,
 			imdb_id, tmdb_id, tvdb_id, path, has_file, size_on_disk,
-			status, monitored, synced_at, created_at, updated_at
-		FROM media
-		WHERE has_file = true AND (%s)
-	`, genreConditions)
+			status, monitored, synced_at, created_at, updated_at`
+	const order = "imdb_rating DESC, popularity DESC"
 
-	if mediaType != "" {
-		query += fmt.Sprintf(" AND media_type = $%d", argIndex)
-		args = append(args, mediaType)
-		argIndex++
+	branches := len(mediaTypes)
+	if branches == 0 {
+		branches = 1
+	}
+	args := make([]interface{}, 0, branches*(len(genres)+len(excludeIDs)+1))
+	argIndex := 1
+
+	// writeWhere writes the genre and exclusion conditions with fresh
+	// placeholders. SQLite binds placeholders by position, so every branch
+	// of the union needs its own copy of the arguments.
+	writeWhere := func(where *strings.Builder) {
+		where.WriteString("has_file = true")
+		if len(genres) > 0 {
+			where.WriteString(" AND (")
+			for i, genre := range genres {
+				if i > 0 {
+					where.WriteString(" OR ")
+				}
+				fmt.Fprintf(where, "genres LIKE $%d", argIndex)
+				args = append(args, "%"+genre+"%")
+				argIndex++
+			}
+			where.WriteString(")")
+		}
+
+		// Exclude specific IDs (e.g., already on cooldown)
+		if len(excludeIDs) > 0 {
+			where.WriteString(" AND id NOT IN (")
+			for i, id := range excludeIDs {
+				if i > 0 {
+					where.WriteString(",")
+				}
+				fmt.Fprintf(where, "$%d", argIndex)
+				args = append(args, id)
+				argIndex++
+			}
+			where.WriteString(")")
+		}
 	}
 
-	// Exclude specific IDs (e.g., already on cooldown)
-	if len(excludeIDs) > 0 {
-		query += " AND id NOT IN ("
-		var querySb274 strings.Builder
-		for i, id := range excludeIDs {
+	var query string
+	if len(mediaTypes) == 0 {
+		var where strings.Builder
+		writeWhere(&where)
+		query = fmt.Sprintf("SELECT %s FROM media WHERE %s ORDER BY %s LIMIT 100",
+			columns, where.String(), order)
+	} else {
+		// One LIMITed branch per type keeps the early stop on
+		// idx_media_genre_lookup; type_order restores the caller's grouping
+		var union strings.Builder
+		for i, mediaType := range mediaTypes {
 			if i > 0 {
-				querySb274.WriteString(",")
+				union.WriteString(" UNION ALL ")
 			}
-			querySb274.WriteString(fmt.Sprintf("$%d", argIndex))
-			args = append(args, id)
+			var where strings.Builder
+			writeWhere(&where)
+			fmt.Fprintf(&union,
+				"SELECT * FROM (SELECT %s, %d AS type_order FROM media WHERE %s AND media_type = $%d ORDER BY %s LIMIT 100) AS t%d",
+				columns, i, where.String(), argIndex, order, i)
+			args = append(args, mediaType)
 			argIndex++
 		}
-		query += querySb274.String()
-		query += ")"
+		query = fmt.Sprintf("SELECT %s FROM (%s) AS typed ORDER BY type_order, %s",
+			columns, union.String(), order)
 	}
 
-	query += " ORDER BY imdb_rating DESC, popularity DESC LIMIT 100"
-
 	rows, err := r.db.Query(ctx, query, args...)
 	if err != nil {
 		return nil, err
@@ -294,6 +300,59 @@ func (r *MediaRepository) DeleteStale(ctx context.Context, source models.MediaSo
 	return result.RowsAffected()
 }
 
+// appendListClauses appends the filter, ordering and paging clauses for
+// opts to query and returns the query with its arguments
+func appendListClauses(query string, opts ListMediaOptions) (string, []interface{}) {
+	args := make([]interface{}, 0)
+	argIndex := 1
+
+	if opts.Source != "" {
+		query += fmt.Sprintf(" AND source = $%d", argIndex)
+		args = append(args, opts.Source)
+		argIndex++
+	}
+
+	if opts.MediaType != "" {
+		query += fmt.Sprintf(" AND media_type = $%d", argIndex)
+		args = append(args, opts.MediaType)
+		argIndex++
+	}
+
+	if opts.HasFile != nil {
+		query += fmt.Sprintf(" AND has_file = $%d", argIndex)
+		args = append(args, *opts.HasFile)
+		argIndex++
+	}
+
+	if opts.MinRating > 0 {
+		query += fmt.Sprintf(" AND imdb_rating >= $%d", argIndex)
+		args = append(args, opts.MinRating)
+		argIndex++
+	}
+
+	// Order by
+	if opts.OrderBy != "" {
+		query += " ORDER BY " + opts.OrderBy
+	} else {
+		query += " ORDER BY title"
+	}
+
+	// Limit
+	if opts.Limit > 0 {
+		query += fmt.Sprintf(" LIMIT $%d", argIndex)
+		args = append(args, opts.Limit)
+		argIndex++
+	}
+
+	// Offset
+	if opts.Offset > 0 {
+		query += fmt.Sprintf(" OFFSET $%d", argIndex)
+		args = append(args, opts.Offset)
+	}
+
+	return query, args
+}
+
 // ListMediaOptions provides filtering options for List
 type ListMediaOptions struct {
 	Source    models.MediaSource
@@ -0,0 +1,69 @@
+package repository
+
+import (
+	"context"
+	"log/slog"
+	"os"
+	"path/filepath"
+	"testing"
+
+	"github.com/geekxflood/program-director/internal/config"
+	"github.com/geekxflood/program-director/internal/database"
+	"github.com/geekxflood/program-director/pkg/models"
+)
+
+func TestListByGenres(t *testing.T) {
+	ctx := context.Background()
+	logger := slog.New(slog.NewTextHandler(os.Stdout, nil))
+
+	db, err := database.NewSQLite(ctx, &config.SQLiteConfig{Path: filepath.Join(t.TempDir(), "test.db")}, logger)
+	if err != nil {
+		t.Fatalf("failed to open database: %v", err)
+	}
+	defer func() { _ = db.Close() }()
+	if err := db.Migrate(ctx); err != nil {
+		t.Fatalf("failed to run migrations: %v", err)
+	}
+
+	repo := NewMediaRepository(db)
+
+	fixtures := []models.Media{
+		{Title: "Heat", MediaType: models.MediaTypeMovie, Genres: models.StringSlice{"Action", "Crime"}, IMDBRating: 8.3, HasFile: true},
+		{Title: "Drive", MediaType: models.MediaTypeMovie, Genres: models.StringSlice{"Drama"}, IMDBRating: 7.8, HasFile: true},
+		{Title: "Airplane!", MediaType: models.MediaTypeMovie, Genres: models.StringSlice{"Comedy"}, IMDBRating: 7.7, HasFile: true},
+		{Title: "Aliens", MediaType: models.MediaTypeMovie, Genres: models.StringSlice{"Action"}, IMDBRating: 8.4, HasFile: true},
+		{Title: "The Wire", MediaType: models.MediaTypeSeries, Genres: models.StringSlice{"Drama"}, IMDBRating: 9.3, HasFile: true},
+		{Title: "24", MediaType: models.MediaTypeSeries, Genres: models.StringSlice{"Action"}, IMDBRating: 8.2, HasFile: false},
+		{Title: "Cowboy Bebop", MediaType: models.MediaTypeAnime, Genres: models.StringSlice{"Action", "Animation"}, IMDBRating: 8.9, HasFile: true},
+	}
+	ids := make(map[string]int64, len(fixtures))
+	for i := range fixtures {
+		m := &fixtures[i]
+		m.ExternalID = int64(i + 1)
+		m.Source = models.MediaSourceRadarr
+		if err := repo.Upsert(ctx, m); err != nil {
+			t.Fatalf("failed to insert %s: %v", m.Title, err)
+		}
+		ids[m.Title] = m.ID
+	}
+
+	media, err := repo.ListByGenres(ctx,
+		[]string{"Action", "Drama"},
+		[]models.MediaType{models.MediaTypeAnime, models.MediaTypeMovie, models.MediaTypeSeries},
+		[]int64{ids["Aliens"]},
+	)
+	if err != nil {
+		t.Fatalf("ListByGenres() error = %v", err)
+	}
+
+	// Grouped by the requested type order, then by rating
+	want := []string{"Cowboy Bebop", "Heat", "Drive", "The Wire"}
+	if len(media) != len(want) {
+		t.Fatalf("ListByGenres() returned %d items, want %d: %+v", len(media), len(want), media)
+	}
+	for i, m := range media {
+		if m.Title != want[i] {
+			t.Errorf("ListByGenres()[%d] = %s, want %s", i, m.Title, want[i])
+		}
+	}
+}
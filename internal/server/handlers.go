@@ -196,19 +196,11 @@ func (s *Server) handleMediaSync(w http.ResponseWriter, r *http.Request) {
 
 	s.logger.Info("media sync triggered via API", "cleanup", cleanup)
 
-	// Sync movies
-	movieResult, err := s.syncService.SyncMovies(ctx, cleanup)
+	// Sync movies and series
+	movieResult, seriesResult, err := s.syncService.SyncAll(ctx, cleanup)
 	if err != nil {
-		s.logger.Error("movie sync failed", "error", err)
-		writeError(w, http.StatusInternalServerError, err, "movie sync failed")
-		return
-	}
-
-	// Sync series
-	seriesResult, err := s.syncService.SyncSeries(ctx, cleanup)
-	if err != nil {
-		s.logger.Error("series sync failed", "error", err)
-		writeError(w, http.StatusInternalServerError, err, "series sync failed")
+		s.logger.Error("media sync failed", "error", err)
+		writeError(w, http.StatusInternalServerError, err, "media sync failed")
 		return
 	}
 
@@ -218,12 +210,14 @@ func (s *Server) handleMediaSync(w http.ResponseWriter, r *http.Request) {
 			"movies": map[string]interface{}{
 				"created": movieResult.Created,
 				"updated": movieResult.Updated,
+				"skipped": movieResult.Skipped,
 				"deleted": movieResult.Deleted,
 				"errors":  movieResult.Errors,
 			},
 			"series": map[string]interface{}{
 				"created": seriesResult.Created,
 				"updated": seriesResult.Updated,
+				"skipped": seriesResult.Skipped,
 				"deleted": seriesResult.Deleted,
 				"errors":  seriesResult.Errors,
 			},
@@ -3,7 +3,10 @@ package media
 
 import (
 	"context"
+	"errors"
+	"fmt"
 	"log/slog"
+	"sync"
 	"time"
 
 	"github.com/geekxflood/program-director/internal/clients/radarr"
@@ -40,17 +43,76 @@ type SyncResult struct {
 	Source   models.MediaSource
 	Created  int
 	Updated  int
+	Skipped  int
 	Deleted  int
 	Errors   int
 	Duration time.Duration
 }
 
+// SyncAll synchronizes movies and series. Both libraries are fetched from
+// Radarr and Sonarr concurrently, then written to the catalog in turn. A
+// failed fetch does not stop the other library from being stored; its result
+// is returned, nil for the failed side, along with the errors.
+func (s *SyncService) SyncAll(ctx context.Context, cleanup bool) (*SyncResult, *SyncResult, error) {
+	start := time.Now()
+
+	s.logger.Info("starting full media sync")
+
+	var (
+		wg                  sync.WaitGroup
+		movies              []radarr.Movie
+		series              []sonarr.Series
+		movieErr, seriesErr error
+	)
+
+	wg.Add(2)
+	go func() {
+		defer wg.Done()
+		movies, movieErr = s.radarr.GetMovies(ctx)
+	}()
+	go func() {
+		defer wg.Done()
+		series, seriesErr = s.sonarr.GetSeries(ctx)
+	}()
+	wg.Wait()
+
+	fetchDuration := time.Since(start)
+	s.logger.Info("fetched media library",
+		"movies", len(movies),
+		"series", len(series),
+		"duration", fetchDuration,
+	)
+
+	var (
+		movieResult, seriesResult *SyncResult
+		errs                      []error
+	)
+
+	if movieErr != nil {
+		errs = append(errs, fmt.Errorf("movie sync failed: %w", movieErr))
+	} else {
+		var err error
+		if movieResult, err = s.storeMovies(ctx, movies, start, cleanup); err != nil {
+			return movieResult, nil, err
+		}
+	}
+
+	if seriesErr != nil {
+		errs = append(errs, fmt.Errorf("series sync failed: %w", seriesErr))
+	} else {
+		// Charge the shared fetch time to series as well, not the movie writes
+		var err error
+		if seriesResult, err = s.storeSeries(ctx, series, time.Now().Add(-fetchDuration), cleanup); err != nil {
+			return movieResult, seriesResult, err
+		}
+	}
+
+	return movieResult, seriesResult, errors.Join(errs...)
+}
+
 // SyncMovies synchronizes movies from Radarr
 func (s *SyncService) SyncMovies(ctx context.Context, cleanup bool) (*SyncResult, error) {
 	start := time.Now()
-	result := &SyncResult{
-		Source: models.MediaSourceRadarr,
-	}
 
 	s.logger.Info("starting movie sync")
 
@@ -62,22 +124,35 @@ func (s *SyncService) SyncMovies(ctx context.Context, cleanup bool) (*SyncResult
 
 	s.logger.Info("fetched movies from Radarr", "count", len(movies))
 
+	return s.storeMovies(ctx, movies, start, cleanup)
+}
+
+// storeMovies upserts fetched Radarr movies into the local catalog
+func (s *SyncService) storeMovies(ctx context.Context, movies []radarr.Movie, start time.Time, cleanup bool) (*SyncResult, error) {
+	result := &SyncResult{
+		Source: models.MediaSourceRadarr,
+	}
+
 	syncTime := time.Now()
 
-	for _, movie := range movies {
+	for i := range movies {
 		select {
 		case <-ctx.Done():
 			return result, ctx.Err()
 		default:
 		}
 
-		media := movie.ToMedia()
+		media := movies[i].ToMedia()
 		media.SyncedAt = syncTime
 
 		// Check if exists
 		existing, err := s.mediaRepo.GetByExternalID(ctx, media.ExternalID, media.Source)
 		if err != nil {
-			// Doesn't exist, create
+			// Doesn't exist; only catalog it once it has a file on disk
+			if !media.HasFile {
+				result.Skipped++
+				continue
+			}
 			if err := s.mediaRepo.Upsert(ctx, media); err != nil {
 				s.logger.Error("failed to create movie",
 					"title", media.Title,
@@ -117,6 +192,7 @@ func (s *SyncService) SyncMovies(ctx context.Context, cleanup bool) (*SyncResult
 	s.logger.Info("movie sync complete",
 		"created", result.Created,
 		"updated", result.Updated,
+		"skipped", result.Skipped,
 		"deleted", result.Deleted,
 		"errors", result.Errors,
 		"duration", result.Duration,
@@ -128,9 +204,6 @@ func (s *SyncService) SyncMovies(ctx context.Context, cleanup bool) (*SyncResult
 // SyncSeries synchronizes series from Sonarr
 func (s *SyncService) SyncSeries(ctx context.Context, cleanup bool) (*SyncResult, error) {
 	start := time.Now()
-	result := &SyncResult{
-		Source: models.MediaSourceSonarr,
-	}
 
 	s.logger.Info("starting series sync")
 
@@ -142,22 +215,35 @@ func (s *SyncService) SyncSeries(ctx context.Context, cleanup bool) (*SyncResult
 
 	s.logger.Info("fetched series from Sonarr", "count", len(series))
 
+	return s.storeSeries(ctx, series, start, cleanup)
+}
+
+// storeSeries upserts fetched Sonarr series into the local catalog
+func (s *SyncService) storeSeries(ctx context.Context, series []sonarr.Series, start time.Time, cleanup bool) (*SyncResult, error) {
+	result := &SyncResult{
+		Source: models.MediaSourceSonarr,
+	}
+
 	syncTime := time.Now()
 
-	for _, show := range series {
+	for i := range series {
 		select {
 		case <-ctx.Done():
 			return result, ctx.Err()
 		default:
 		}
 
-		media := show.ToMedia()
+		media := series[i].ToMedia()
 		media.SyncedAt = syncTime
 
 		// Check if exists
 		existing, err := s.mediaRepo.GetByExternalID(ctx, media.ExternalID, media.Source)
 		if err != nil {
-			// Doesn't exist, create
+			// Doesn't exist; only catalog it once it has a file on disk
+			if !media.HasFile {
+				result.Skipped++
+				continue
+			}
 			if err := s.mediaRepo.Upsert(ctx, media); err != nil {
 				s.logger.Error("failed to create series",
 					"title", media.Title,
@@ -197,6 +283,7 @@ func (s *SyncService) SyncSeries(ctx context.Context, cleanup bool) (*SyncResult
 	s.logger.Info("series sync complete",
 		"created", result.Created,
 		"updated", result.Updated,
+		"skipped", result.Skipped,
 		"deleted", result.Deleted,
 		"errors", result.Errors,
 		"duration", result.Duration,
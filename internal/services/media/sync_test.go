@@ -0,0 +1,70 @@
+package media
+
+import (
+	"context"
+	"log/slog"
+	"net/http"
+	"net/http/httptest"
+	"os"
+	"path/filepath"
+	"testing"
+
+	"github.com/geekxflood/program-director/internal/clients/radarr"
+	"github.com/geekxflood/program-director/internal/clients/sonarr"
+	"github.com/geekxflood/program-director/internal/config"
+	"github.com/geekxflood/program-director/internal/database"
+	"github.com/geekxflood/program-director/internal/database/repository"
+	"github.com/geekxflood/program-director/pkg/models"
+)
+
+func TestSyncAllStoresMoviesWhenSeriesFetchFails(t *testing.T) {
+	ctx := context.Background()
+	logger := slog.New(slog.NewTextHandler(os.Stdout, nil))
+
+	radarrServer := httptest.NewServer(http.HandlerFunc(func(w http.ResponseWriter, _ *http.Request) {
+		w.Header().Set("Content-Type", "application/json")
+		_, _ = w.Write([]byte(`[{"id":1,"title":"Alien","year":1979,"genres":["Horror"],"hasFile":true}]`))
+	}))
+	defer radarrServer.Close()
+
+	sonarrServer := httptest.NewServer(http.HandlerFunc(func(w http.ResponseWriter, _ *http.Request) {
+		w.WriteHeader(http.StatusUnauthorized)
+	}))
+	defer sonarrServer.Close()
+
+	db, err := database.NewSQLite(ctx, &config.SQLiteConfig{Path: filepath.Join(t.TempDir(), "test.db")}, logger)
+	if err != nil {
+		t.Fatalf("failed to open database: %v", err)
+	}
+	defer func() { _ = db.Close() }()
+	if err := db.Migrate(ctx); err != nil {
+		t.Fatalf("failed to run migrations: %v", err)
+	}
+
+	mediaRepo := repository.NewMediaRepository(db)
+	service := NewSyncService(
+		radarr.New(&config.RadarrConfig{URL: radarrServer.URL, APIKey: "key"}),
+		sonarr.New(&config.SonarrConfig{URL: sonarrServer.URL, APIKey: "key"}),
+		mediaRepo,
+		logger,
+	)
+
+	movieResult, seriesResult, err := service.SyncAll(ctx, false)
+	if err == nil {
+		t.Fatal("expected series fetch error")
+	}
+	if seriesResult != nil {
+		t.Errorf("expected nil series result, got %+v", seriesResult)
+	}
+	if movieResult == nil || movieResult.Created != 1 {
+		t.Fatalf("expected one created movie, got %+v", movieResult)
+	}
+
+	count, err := mediaRepo.Count(ctx, repository.ListMediaOptions{Source: models.MediaSourceRadarr})
+	if err != nil {
+		t.Fatalf("failed to count movies: %v", err)
+	}
+	if count != 1 {
+		t.Errorf("expected 1 stored movie, got %d", count)
+	}
+}
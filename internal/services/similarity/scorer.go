@@ -15,6 +15,10 @@ import (
 	"github.com/geekxflood/program-director/pkg/models"
 )
 
+// allMediaTypes is searched when a theme does not restrict media types.
+// It is shared across calls and must not be modified.
+var allMediaTypes = []models.MediaType{models.MediaTypeMovie, models.MediaTypeSeries, models.MediaTypeAnime}
+
 // Scorer handles content similarity scoring
 type Scorer struct {
 	mediaRepo *repository.MediaRepository
@@ -99,49 +103,53 @@ func (s *Scorer) filterByGenre(ctx context.Context, theme *config.ThemeConfig, e
 
 	// If no specific types, include all
 	if len(mediaTypes) == 0 {
-		mediaTypes = []models.MediaType{models.MediaTypeMovie, models.MediaTypeSeries, models.MediaTypeAnime}
+		mediaTypes = allMediaTypes
 	}
 
-	var candidates []models.MediaWithScore
+	// Lowercase theme genres and keywords once instead of per candidate
+	themeGenres := lowerAll(theme.Genres)
+	keywords := lowerAll(theme.Keywords)
 
-	for _, mediaType := range mediaTypes {
-		// Fetch media matching genres
-		media, err := s.mediaRepo.ListByGenres(ctx, theme.Genres, mediaType, excludeIDs)
-		if err != nil {
-			return nil, err
-		}
+	// Fetch media matching genres for every type in one query
+	media, err := s.mediaRepo.ListByGenres(ctx, theme.Genres, mediaTypes, excludeIDs)
+	if err != nil {
+		return nil, err
+	}
 
-		for _, m := range media {
-			// Skip if below minimum rating
-			if theme.MinRating > 0 && m.IMDBRating < theme.MinRating {
-				continue
-			}
+	candidates := make([]models.MediaWithScore, 0, len(media))
+	for i := range media {
+		m := &media[i]
 
-			// Calculate genre score
-			score := s.calculateGenreScore(m.Genres, theme.Genres)
+		// Skip if below minimum rating
+		if theme.MinRating > 0 && m.IMDBRating < theme.MinRating {
+			continue
+		}
 
-			// Add keyword bonus
-			if len(theme.Keywords) > 0 {
-				score += s.calculateKeywordScore(m.Title, m.Overview, theme.Keywords)
-			}
+		// Calculate genre score
+		score := s.calculateGenreScore(m.Genres, themeGenres)
 
-			// Add rating bonus
-			if m.IMDBRating > 0 {
-				score += m.IMDBRating / 20 // Small bonus for highly rated content
-			}
+		// Add keyword bonus
+		if len(keywords) > 0 {
+			score += s.calculateKeywordScore(m.Title, m.Overview, keywords)
+		}
 
-			candidates = append(candidates, models.MediaWithScore{
-				Media:       m,
-				Score:       score,
-				MatchReason: fmt.Sprintf("Genre match: %.0f%%", score*100),
-			})
+		// Add rating bonus
+		if m.IMDBRating > 0 {
+			score += m.IMDBRating / 20 // Small bonus for highly rated content
 		}
+
+		candidates = append(candidates, models.MediaWithScore{
+			Media:       *m,
+			Score:       score,
+			MatchReason: fmt.Sprintf("Genre match: %.0f%%", score*100),
+		})
 	}
 
 	return candidates, nil
 }
 
-// calculateGenreScore calculates how well media genres match theme genres
+// calculateGenreScore calculates how well media genres match theme genres.
+// themeGenres must already be lowercased.
 func (s *Scorer) calculateGenreScore(mediaGenres models.StringSlice, themeGenres []string) float64 {
 	if len(themeGenres) == 0 {
 		return 0.5 // Neutral score if no genres specified
@@ -151,8 +159,7 @@ func (s *Scorer) calculateGenreScore(mediaGenres models.StringSlice, themeGenres
 	for _, mg := range mediaGenres {
 		mgLower := strings.ToLower(mg)
 		for _, tg := range themeGenres {
-			if strings.Contains(mgLower, strings.ToLower(tg)) ||
-				strings.Contains(strings.ToLower(tg), mgLower) {
+			if strings.Contains(mgLower, tg) || strings.Contains(tg, mgLower) {
 				matches++
 				break
 			}
@@ -163,7 +170,8 @@ func (s *Scorer) calculateGenreScore(mediaGenres models.StringSlice, themeGenres
 	return float64(matches) / float64(len(themeGenres))
 }
 
-// calculateKeywordScore calculates keyword match score
+// calculateKeywordScore calculates keyword match score. keywords must
+// already be lowercased.
 func (s *Scorer) calculateKeywordScore(title, overview string, keywords []string) float64 {
 	if len(keywords) == 0 {
 		return 0
@@ -173,7 +181,7 @@ func (s *Scorer) calculateKeywordScore(title, overview string, keywords []string
 	matches := 0
 
 	for _, kw := range keywords {
-		if strings.Contains(text, strings.ToLower(kw)) {
+		if strings.Contains(text, kw) {
 			matches++
 		}
 	}
@@ -184,15 +192,19 @@ func (s *Scorer) calculateKeywordScore(title, overview string, keywords []string
 // refinWithLLM uses the LLM to refine and score candidates
 func (s *Scorer) refinWithLLM(ctx context.Context, theme *config.ThemeConfig, candidates []models.MediaWithScore) ([]models.MediaWithScore, error) {
 	// Build media summary for LLM
+	// Rows are formatted straight into the builder, sized for a title line
+	// plus a truncated overview per candidate
 	var mediaSummary strings.Builder
+	mediaSummary.Grow(len(candidates) * 320)
 	mediaSummary.WriteString("Media candidates:\n")
-	for i, c := range candidates {
-		mediaSummary.WriteString(fmt.Sprintf("%d. \"%s\" (%d) - Genres: %s - Rating: %.1f\n",
-			i+1, c.Title, c.Year, strings.Join(c.Genres, ", "), c.IMDBRating))
+	for i := range candidates {
+		c := &candidates[i]
+		fmt.Fprintf(&mediaSummary, "%d. \"%s\" (%d) - Genres: %s - Rating: %.1f\n",
+			i+1, c.Title, c.Year, strings.Join(c.Genres, ", "), c.IMDBRating)
 		if c.Overview != "" && len(c.Overview) > 200 {
-			mediaSummary.WriteString(fmt.Sprintf("   %s...\n", c.Overview[:200]))
+			fmt.Fprintf(&mediaSummary, "   %s...\n", c.Overview[:200])
 		} else if c.Overview != "" {
-			mediaSummary.WriteString(fmt.Sprintf("   %s\n", c.Overview))
+			fmt.Fprintf(&mediaSummary, "   %s\n", c.Overview)
 		}
 	}
 
@@ -266,6 +278,15 @@ Rank ALL items by how well they fit this theme. Output JSON only.`,
 	return candidates, nil
 }
 
+// lowerAll returns a lowercased copy of values
+func lowerAll(values []string) []string {
+	lowered := make([]string, len(values))
+	for i, v := range values {
+		lowered[i] = strings.ToLower(v)
+	}
+	return lowered
+}
+
 func minInt(a, b int) int {
 	if a < b {
 		return a
@@ -0,0 +1,95 @@
+package similarity
+
+import (
+	"math"
+	"testing"
+
+	"github.com/geekxflood/program-director/pkg/models"
+)
+
+func TestCalculateGenreScore(t *testing.T) {
+	s := &Scorer{}
+
+	tests := []struct {
+		name        string
+		mediaGenres models.StringSlice
+		themeGenres []string
+		want        float64
+	}{
+		{
+			name:        "no theme genres",
+			mediaGenres: models.StringSlice{"Action"},
+			themeGenres: nil,
+			want:        0.5,
+		},
+		{
+			name:        "case-insensitive match",
+			mediaGenres: models.StringSlice{"Science Fiction", "Drama"},
+			themeGenres: []string{"Science", "Horror"},
+			want:        0.5,
+		},
+		{
+			name:        "media genre contained in theme genre",
+			mediaGenres: models.StringSlice{"Sci-Fi"},
+			themeGenres: []string{"Sci-Fi & Fantasy"},
+			want:        1,
+		},
+		{
+			name:        "no match",
+			mediaGenres: models.StringSlice{"Comedy"},
+			themeGenres: []string{"Horror"},
+			want:        0,
+		},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			got := s.calculateGenreScore(tt.mediaGenres, lowerAll(tt.themeGenres))
+			if math.Abs(got-tt.want) > 1e-9 {
+				t.Errorf("calculateGenreScore() = %v, want %v", got, tt.want)
+			}
+		})
+	}
+}
+
+func TestCalculateKeywordScore(t *testing.T) {
+	s := &Scorer{}
+
+	tests := []struct {
+		name     string
+		title    string
+		overview string
+		keywords []string
+		want     float64
+	}{
+		{
+			name:     "no keywords",
+			title:    "Alien",
+			keywords: nil,
+			want:     0,
+		},
+		{
+			name:     "title and overview matches",
+			title:    "Alien",
+			overview: "A crew encounters a deadly creature in SPACE.",
+			keywords: []string{"Alien", "space", "robot"},
+			want:     2.0 / 3.0 * 0.3,
+		},
+		{
+			name:     "no match",
+			title:    "Heat",
+			overview: "A heist in Los Angeles.",
+			keywords: []string{"space"},
+			want:     0,
+		},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			got := s.calculateKeywordScore(tt.title, tt.overview, lowerAll(tt.keywords))
+			if math.Abs(got-tt.want) > 1e-9 {
+				t.Errorf("calculateKeywordScore() = %v, want %v", got, tt.want)
+			}
+		})
+	}
+}